@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Final
 
 import logging
+import sys
 
 from lucidmotors import LucidAPI, Vehicle, Model, ModelVariant, enum_to_str
 
@@ -14,12 +19,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import IntegrationError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.loader import async_get_integration
 
 from .const import ATTRIBUTION, DOMAIN
 from .coordinator import LucidDataUpdateCoordinator
 from .config_flow import region_by_name
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.DEVICE_TRACKER,
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
@@ -32,10 +38,39 @@ PLATFORMS: list[Platform] = [
     Platform.COVER,
     Platform.NUMBER,
     Platform.SELECT,
-]
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Vehicles sharing a model/variant share their names as well
+_enum_to_str = lru_cache(maxsize=64)(enum_to_str)
+
+
+def _device_info_for(vin: str, nickname: str, model: int, variant: int) -> DeviceInfo:
+    """Build the device info for one of a vehicle's entities."""
+    model_str = _enum_to_str(Model, model)
+    variant_str = _enum_to_str(ModelVariant, variant)
+    return DeviceInfo(
+        identifiers={(DOMAIN, vin)},
+        manufacturer="Lucid Motors",
+        model=f"{model_str} {variant_str}",
+        name=nickname,
+    )
+
+
+@lru_cache(maxsize=16)
+def _vehicle_attrs_for(vin: str, nickname: str) -> Mapping[str, Any]:
+    """Build the state attributes shared by a vehicle's entities.
+
+    The returned mapping is shared between entities, so it is read-only.
+    """
+    return MappingProxyType(
+        {
+            "car": nickname,
+            "vin": vin,
+        }
+    )
+
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old entry."""
@@ -68,13 +103,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     region = region_by_name(entry.data["region"])
     api = LucidAPI(auto_wake=True, region=region)
-    await api.login(entry.data["username"], entry.data["password"])
-    assert api.user is not None
+    try:
+        await api.login(entry.data["username"], entry.data["password"])
+        assert api.user is not None
 
-    coordinator = LucidDataUpdateCoordinator(
-        hass, api, entry.data["username"], entry.data["password"]
-    )
-    await coordinator.async_config_entry_first_refresh()
+        coordinator = LucidDataUpdateCoordinator(
+            hass, api, entry.data["username"], entry.data["password"]
+        )
+
+        # Platforms need the first refresh to have completed before they can
+        # add entities, but importing them does not, so do that while we wait
+        # on the API.
+        integration = await async_get_integration(hass, DOMAIN)
+        await asyncio.gather(
+            coordinator.async_config_entry_first_refresh(),
+            integration.async_get_platforms(PLATFORMS),
+        )
+    except BaseException:
+        # Don't leak the API channel if setup is going to be retried
+        await api.close()
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -87,6 +135,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
         await coordinator.api.close()
 
     return unload_ok
@@ -98,9 +147,11 @@ class LucidBaseEntity(CoordinatorEntity[LucidDataUpdateCoordinator]):
     coordinator: LucidDataUpdateCoordinator
     vin: str
 
+    # "<vin>-", shared by the unique IDs of all of this vehicle's entities
+    _vin_prefix: str
+
     _attr_attribution: str = ATTRIBUTION
     _attr_has_entity_name: bool = True
-    _attrs: dict[str, Any]
 
     def __init__(
         self, coordinator: LucidDataUpdateCoordinator, vehicle: Vehicle
@@ -108,19 +159,12 @@ class LucidBaseEntity(CoordinatorEntity[LucidDataUpdateCoordinator]):
         """Initialize entity."""
         super().__init__(coordinator)
 
-        self.vin = vehicle.config.vin
+        config = vehicle.config
+        self.vin = config.vin
+        self._vin_prefix = sys.intern(config.vin + "-")
 
-        self._attrs = {
-            "car": vehicle.config.nickname,
-            "vin": self.vin,
-        }
-        model_str = enum_to_str(Model, vehicle.config.model)
-        variant_str = enum_to_str(ModelVariant, vehicle.config.variant)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, vehicle.config.vin)},
-            manufacturer="Lucid Motors",
-            model=f"{model_str} {variant_str}",
-            name=vehicle.config.nickname,
+        self._attr_device_info = _device_info_for(
+            config.vin, config.nickname, config.model, config.variant
         )
 
     async def async_added_to_hass(self) -> None:
@@ -128,10 +172,15 @@ class LucidBaseEntity(CoordinatorEntity[LucidDataUpdateCoordinator]):
         await super().async_added_to_hass()
         self._handle_coordinator_update()
 
+    @cached_property
+    def _attrs(self) -> Mapping[str, Any]:
+        """Get the state attributes common to this vehicle's entities."""
+        return _vehicle_attrs_for(self.vin, self.vehicle.config.nickname)
+
     @property
     def vehicle(self) -> Vehicle:
         """Get the vehicle associated with this Entity."""
-        vehicle = self.coordinator.get_vehicle(self.vin)
+        vehicle = self.coordinator.vehicles_by_vin.get(self.vin)
         if vehicle is None:
             raise IntegrationError(f"Vehicle {self.vin} disappeared")
         return vehicle
@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass, field
 import logging
+from operator import attrgetter
+from typing import Any
 
 from lucidmotors import Vehicle, WalkawayState, DoorState, HvacPower
 
@@ -32,86 +34,98 @@ class LucidBinarySensorEntityDescription(BinarySensorEntityDescription):
     is_on_fn: Callable = lambda x, y: x
 
 
-SENSOR_TYPES: dict[str, LucidBinarySensorEntityDescription] = {
-    "front_left_door": LucidBinarySensorEntityDescription(
+def _equal(path: str, value: Any) -> Callable[[Vehicle], bool]:
+    """Build an is_on_fn which is true when the value at path equals value."""
+    getter = attrgetter(path)
+
+    def is_on(vehicle: Vehicle) -> bool:
+        return getter(vehicle) == value
+
+    return is_on
+
+
+def _not_equal(path: str, value: Any) -> Callable[[Vehicle], bool]:
+    """Build an is_on_fn which is true when the value at path isn't value."""
+    getter = attrgetter(path)
+
+    def is_on(vehicle: Vehicle) -> bool:
+        return getter(vehicle) != value
+
+    return is_on
+
+
+SENSOR_TYPES: tuple[LucidBinarySensorEntityDescription, ...] = (
+    LucidBinarySensorEntityDescription(
         key="front_left_door",
         key_path=["state", "body"],
         translation_key="front_left_door",
         icon="mdi:door",
         device_class=BinarySensorDeviceClass.DOOR,
-        is_on_fn=lambda vehicle: vehicle.state.body.front_left_door
-        != DoorState.DOOR_STATE_CLOSED,
+        is_on_fn=_not_equal("state.body.front_left_door", DoorState.DOOR_STATE_CLOSED),
     ),
-    "front_right_door": LucidBinarySensorEntityDescription(
+    LucidBinarySensorEntityDescription(
         key="front_right_door",
         key_path=["state", "body"],
         translation_key="front_right_door",
         icon="mdi:door",
         device_class=BinarySensorDeviceClass.DOOR,
-        is_on_fn=lambda vehicle: vehicle.state.body.front_right_door
-        != DoorState.DOOR_STATE_CLOSED,
+        is_on_fn=_not_equal("state.body.front_right_door", DoorState.DOOR_STATE_CLOSED),
     ),
-    "rear_left_door": LucidBinarySensorEntityDescription(
+    LucidBinarySensorEntityDescription(
         key="rear_left_door",
         key_path=["state", "body"],
         translation_key="rear_left_door",
         icon="mdi:door",
         device_class=BinarySensorDeviceClass.DOOR,
-        is_on_fn=lambda vehicle: vehicle.state.body.rear_left_door
-        != DoorState.DOOR_STATE_CLOSED,
+        is_on_fn=_not_equal("state.body.rear_left_door", DoorState.DOOR_STATE_CLOSED),
     ),
-    "rear_right_door": LucidBinarySensorEntityDescription(
+    LucidBinarySensorEntityDescription(
         key="rear_right_door",
         key_path=["state", "body"],
         translation_key="rear_right_door",
         icon="mdi:door",
         device_class=BinarySensorDeviceClass.DOOR,
-        is_on_fn=lambda vehicle: vehicle.state.body.rear_right_door
-        != DoorState.DOOR_STATE_CLOSED,
+        is_on_fn=_not_equal("state.body.rear_right_door", DoorState.DOOR_STATE_CLOSED),
     ),
-    "frunk": LucidBinarySensorEntityDescription(
+    LucidBinarySensorEntityDescription(
         key="front_cargo",
         key_path=["state", "body"],
         translation_key="front_cargo",
         icon="mdi:door",
         device_class=BinarySensorDeviceClass.DOOR,
-        is_on_fn=lambda vehicle: vehicle.state.body.front_cargo
-        != DoorState.DOOR_STATE_CLOSED,
+        is_on_fn=_not_equal("state.body.front_cargo", DoorState.DOOR_STATE_CLOSED),
     ),
-    "trunk": LucidBinarySensorEntityDescription(
+    LucidBinarySensorEntityDescription(
         key="rear_cargo",
         key_path=["state", "body"],
         translation_key="rear_cargo",
         icon="mdi:door",
         device_class=BinarySensorDeviceClass.DOOR,
-        is_on_fn=lambda vehicle: vehicle.state.body.rear_cargo
-        != DoorState.DOOR_STATE_CLOSED,
+        is_on_fn=_not_equal("state.body.rear_cargo", DoorState.DOOR_STATE_CLOSED),
     ),
-    "charge_port_door": LucidBinarySensorEntityDescription(
+    LucidBinarySensorEntityDescription(
         key="charge_port",
         key_path=["state", "body"],
         translation_key="charge_port_door",
         icon="mdi:door",
         device_class=BinarySensorDeviceClass.DOOR,
-        is_on_fn=lambda vehicle: vehicle.state.body.charge_port
-        != DoorState.DOOR_STATE_CLOSED,
+        is_on_fn=_not_equal("state.body.charge_port", DoorState.DOOR_STATE_CLOSED),
     ),
-    "walkaway_lock": LucidBinarySensorEntityDescription(
+    LucidBinarySensorEntityDescription(
         key="walkaway_lock",
         key_path=["state", "body"],
         translation_key="walkaway_lock",
         icon="mdi:upload-lock",
-        is_on_fn=lambda vehicle: vehicle.state.body.walkaway_lock
-        == WalkawayState.WALKAWAY_ACTIVE,
+        is_on_fn=_equal("state.body.walkaway_lock", WalkawayState.WALKAWAY_ACTIVE),
     ),
-    "hvac_power": LucidBinarySensorEntityDescription(
+    LucidBinarySensorEntityDescription(
         key="power",
         key_path=["state", "hvac"],
         translation_key="hvac_power",
         icon="mdi:hvac",
-        is_on_fn=lambda vehicle: vehicle.state.hvac.power != HvacPower.HVAC_OFF,
+        is_on_fn=_not_equal("state.hvac.power", HvacPower.HVAC_OFF),
     ),
-}
+)
 
 
 async def async_setup_entry(
@@ -122,17 +136,11 @@ async def async_setup_entry(
     """Set up the Lucid sensors from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidBinarySensor] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.extend(
-            [
-                LucidBinarySensor(coordinator, vehicle, description)
-                for (attribute_name, description) in SENSOR_TYPES.items()
-            ]
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        LucidBinarySensor(coordinator, vehicle, description)
+        for vehicle in coordinator.api.vehicles
+        for description in SENSOR_TYPES
+    )
 
 
 class LucidBinarySensor(LucidBaseEntity, BinarySensorEntity):
@@ -150,28 +158,17 @@ class LucidBinarySensor(LucidBaseEntity, BinarySensorEntity):
         """Initialize Lucid binary vehicle sensor."""
         super().__init__(coordinator, vehicle)
         self.entity_description = description
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
+        self._attr_translation_key = description.translation_key
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            "Updating binary sensor '%s' of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
-        state = self.vehicle
-        for attr in self.entity_description.key_path:
-            state = getattr(state, attr)
-        state = getattr(state, self.entity_description.key)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updating binary sensor '%s' of %s",
+                self.entity_description.key,
+                self.vehicle.config.nickname,
+            )
+        self._attr_is_on = self.entity_description.is_on_fn(self.vehicle)
         super()._handle_coordinator_update()
-
-    @property
-    def is_on(self) -> bool:
-        """Return the state."""
-        return self.entity_description.is_on_fn(self.vehicle)
-
-    @property
-    def translation_key(self) -> str | None:
-        """Return the translation key to translate the entity's states."""
-        return self.entity_description.translation_key
@@ -40,19 +40,19 @@ BUTTON_TYPES: tuple[LucidButtonEntityDescription, ...] = (
         key="flash_lights",
         translation_key="flash_lights",
         icon="mdi:car-light-alert",
-        remote_function=lambda api, vehicle: api.lights_flash(vehicle),
+        remote_function=LucidAPI.lights_flash,
     ),
     LucidButtonEntityDescription(
         key="wake_up",
         translation_key="wake_up",
         icon="mdi:sleep-off",
-        remote_function=lambda api, vehicle: api.wakeup_vehicle(vehicle),
+        remote_function=LucidAPI.wakeup_vehicle,
     ),
     LucidButtonEntityDescription(
         key="honk_horn",
         translation_key="honk_horn",
         icon="mdi:bugle",
-        remote_function=lambda api, vehicle: api.honk_horn(vehicle),
+        remote_function=LucidAPI.honk_horn,
     ),
 )
 
@@ -65,17 +65,11 @@ async def async_setup_entry(
     """Set up the Lucid sensors from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidButton] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.extend(
-            [
-                LucidButton(coordinator, vehicle, description)
-                for description in BUTTON_TYPES
-            ]
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        LucidButton(coordinator, vehicle, description)
+        for vehicle in coordinator.api.vehicles
+        for description in BUTTON_TYPES
+    )
 
 
 class LucidButton(LucidBaseEntity, ButtonEntity):
@@ -94,7 +88,7 @@ class LucidButton(LucidBaseEntity, ButtonEntity):
         super().__init__(coordinator, vehicle)
         self.entity_description = description
         self.api = coordinator.api
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
 
     async def async_press(self) -> None:
         """Press the button."""
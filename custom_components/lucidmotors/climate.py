@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 import logging
 from typing import Any, Optional
@@ -60,12 +61,10 @@ async def async_setup_entry(
     """Set up the Lucid sensors from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidClimate] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.append(LucidClimate(coordinator, vehicle, CLIMATE_DESCRIPTION))
-
-    async_add_entities(entities)
+    async_add_entities(
+        LucidClimate(coordinator, vehicle, CLIMATE_DESCRIPTION)
+        for vehicle in coordinator.api.vehicles
+    )
 
 
 class LucidClimate(LucidBaseEntity, ClimateEntity):
@@ -90,6 +89,11 @@ class LucidClimate(LucidBaseEntity, ClimateEntity):
     _attr_preset_mode: Optional[str] = None
     _attr_target_temperature: Optional[float] = DEFAULT_TARGET_TEMPERATURE
     _saved_target_temperature: float = DEFAULT_TARGET_TEMPERATURE
+    _last_snapshot: tuple[Any, ...] | None = None
+    # HVAC mode and preset as last reported by the vehicle, as opposed to the
+    # optimistic values we write when changing them
+    _reported_hvac_mode: HVACMode | None = None
+    _reported_preset_mode: str | None = None
 
     def __init__(
         self,
@@ -101,7 +105,7 @@ class LucidClimate(LucidBaseEntity, ClimateEntity):
         super().__init__(coordinator, vehicle)
         self.entity_description = description
         self.api = coordinator.api
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
         self._attr_hvac_mode = None
         self._attr_preset_mode = None
 
@@ -115,57 +119,80 @@ class LucidClimate(LucidBaseEntity, ClimateEntity):
 
         self._attr_target_temperature = target
 
+    def _update_hvac_on(self, defrost: int, current: float) -> None:
+        """Update HVAC mode and action while climate control is running."""
+        self._attr_hvac_mode = HVACMode.HEAT_COOL
+        if defrost == DefrostState.DEFROST_ON:
+            self._attr_hvac_action = HVACAction.HEATING
+            self._set_target_temperature(None)
+            return
+
+        target = self._attr_target_temperature
+        if target is None:
+            target = self._saved_target_temperature
+            self._set_target_temperature(target)
+        if target is None:
+            self._attr_hvac_action = None
+        elif current >= target:
+            self._attr_hvac_action = HVACAction.COOLING
+        else:
+            self._attr_hvac_action = HVACAction.HEATING
+
+    def _update_hvac_off(self, defrost: int, current: float) -> None:
+        """Update HVAC mode and action while climate control is off."""
+        self._attr_hvac_action = HVACAction.OFF
+        self._attr_hvac_mode = HVACMode.OFF
+
+    def _update_hvac_unknown(self, defrost: int, current: float) -> None:
+        """Update HVAC mode and action when the HVAC power state is unknown."""
+        self._attr_hvac_action = None
+        self._attr_hvac_mode = None
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            "Updating climate entity for %s",
-            self.vehicle.config.nickname,
+        vehicle = self.vehicle
+        hvac = vehicle.state.hvac
+        power = hvac.power
+        defrost = hvac.defrost
+        current = vehicle.state.cabin.interior_temp
+
+        # Skip recomputing and writing state unless something we derive our
+        # attributes from has changed since the last update.
+        snapshot = (
+            self.coordinator.last_update_success,
+            power,
+            defrost,
+            current,
+            self._attr_target_temperature,
         )
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
 
         # Update entity attributes
-        self._attr_current_temperature = self.vehicle.state.cabin.interior_temp
-        match self.vehicle.state.hvac.power:
-            case HvacPower.HVAC_ON | HvacPower.HVAC_PRECONDITION:
-                target = self._attr_target_temperature
-                if self.vehicle.state.hvac.defrost == DefrostState.DEFROST_ON:
-                    self._attr_hvac_mode = HVACMode.HEAT_COOL
-                    self._attr_hvac_action = HVACAction.HEATING
-                    self._set_target_temperature(None)
-                else:
-                    current = self.vehicle.state.cabin.interior_temp
-                    if target is None:
-                        target = self._saved_target_temperature
-                        self._set_target_temperature(target)
-                    self._attr_hvac_mode = HVACMode.HEAT_COOL
-                    if target is None:
-                        self._attr_hvac_action = None
-                    elif current >= target:
-                        self._attr_hvac_action = HVACAction.COOLING
-                    else:
-                        self._attr_hvac_action = HVACAction.HEATING
-            case HvacPower.HVAC_OFF:
-                self._attr_hvac_action = HVACAction.OFF
-                self._attr_hvac_mode = HVACMode.OFF
-            case _:
-                self._attr_hvac_action = None
-                self._attr_hvac_mode = None
-
-        match self.vehicle.state.hvac.defrost:
-            case DefrostState.DEFROST_ON:
-                self._attr_preset_mode = "Defrost"
-            case DefrostState.DEFROST_OFF:
-                self._attr_preset_mode = "Normal"
-
-        _LOGGER.info(
-            "HVAC power: %r; action: %r; mode: %r; target: %r; current: %r",
-            self.vehicle.state.hvac.power,
-            self._attr_hvac_action,
-            self._attr_hvac_mode,
-            self._attr_target_temperature,
-            self.vehicle.state.cabin.interior_temp,
+        self._attr_current_temperature = current
+        _HVAC_POWER_HANDLERS.get(power, LucidClimate._update_hvac_unknown)(
+            self, defrost, current
         )
 
+        if (preset_mode := _DEFROST_PRESET_MODES.get(defrost)) is not None:
+            self._attr_preset_mode = preset_mode
+        self._reported_hvac_mode = self._attr_hvac_mode
+        self._reported_preset_mode = preset_mode
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updating climate entity for %s: "
+                "HVAC power: %r; action: %r; mode: %r; target: %r; current: %r",
+                vehicle.config.nickname,
+                power,
+                self._attr_hvac_action,
+                self._attr_hvac_mode,
+                self._attr_target_temperature,
+                current,
+            )
+
         super()._handle_coordinator_update()
 
     async def _expect_update(self) -> None:
@@ -176,43 +203,68 @@ class LucidClimate(LucidBaseEntity, ClimateEntity):
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
+        if preset_mode == self._reported_preset_mode == self._attr_preset_mode:
+            # The car already reports this preset, and no change is pending
+            return
+
         _LOGGER.debug(
             "Setting preset mode of %s to %s",
             self.vehicle.config.nickname,
             preset_mode,
         )
 
+        previous_preset_mode = self._attr_preset_mode
         self._attr_preset_mode = preset_mode
+        # The snapshot doesn't cover our optimistic mode and preset; make the
+        # next update recompute them from the vehicle even if it's unchanged.
+        self._last_snapshot = None
         self.async_write_ha_state()
 
-        if preset_mode == "Normal":
-            await self.api.defrost_off(self.vehicle)
-            self._set_target_temperature(self._saved_target_temperature)
-        elif preset_mode == "Defrost":
-            await self.api.defrost_on(self.vehicle)
-            # Target temperature is not applicable in Defrost mode
-            self._set_target_temperature(None)
+        try:
+            if preset_mode == "Normal":
+                await self.api.defrost_off(self.vehicle)
+                self._set_target_temperature(self._saved_target_temperature)
+            elif preset_mode == "Defrost":
+                await self.api.defrost_on(self.vehicle)
+                # Target temperature is not applicable in Defrost mode
+                self._set_target_temperature(None)
+        except APIError as ex:
+            self._attr_preset_mode = previous_preset_mode
+            self.async_write_ha_state()
+            raise HomeAssistantError(ex) from ex
 
         await self._expect_update()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
+        if hvac_mode == self._reported_hvac_mode == self._attr_hvac_mode:
+            # The car already reports this mode, and no change is pending
+            return
+
         _LOGGER.debug(
             "Setting HVAC mode of %s to %r",
             self.vehicle.config.nickname,
             hvac_mode,
         )
 
+        previous_hvac_mode = self._attr_hvac_mode
         self._attr_hvac_mode = hvac_mode
-        await self.async_set_temperature(temperature=self._attr_target_temperature)
-
-        self.async_write_ha_state()
-        await self._expect_update()
+        self._last_snapshot = None
+        # Writes state and expects an update once the new mode has been sent
+        try:
+            await self.async_set_temperature()
+        except HomeAssistantError:
+            self._attr_hvac_mode = previous_hvac_mode
+            self.async_write_ha_state()
+            raise
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set temperature."""
         temperature = kwargs.get("temperature")
+        previous_target = self._attr_target_temperature
         if temperature is not None:
+            # The car doesn't report its target temperature, so there's no
+            # telling whether it already has this one; always send it.
             self._set_target_temperature(temperature)
 
         hvac_mode = self.hvac_mode
@@ -245,4 +297,20 @@ class LucidClimate(LucidBaseEntity, ClimateEntity):
             self.async_write_ha_state()
             await self._expect_update()
         except APIError as ex:
+            self._attr_target_temperature = previous_target
+            self.async_write_ha_state()
             raise HomeAssistantError(ex) from ex
+
+
+# HVAC power state -> LucidClimate method updating HVAC mode and action
+_HVAC_POWER_HANDLERS: dict[int, Callable[[LucidClimate, int, float], None]] = {
+    HvacPower.HVAC_ON: LucidClimate._update_hvac_on,
+    HvacPower.HVAC_PRECONDITION: LucidClimate._update_hvac_on,
+    HvacPower.HVAC_OFF: LucidClimate._update_hvac_off,
+}
+
+# Defrost state -> preset mode. Other defrost states keep the current preset.
+_DEFROST_PRESET_MODES: dict[int, str] = {
+    DefrostState.DEFROST_ON: "Defrost",
+    DefrostState.DEFROST_OFF: "Normal",
+}
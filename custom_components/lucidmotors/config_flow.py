@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 import logging
 from typing import Any
 
@@ -18,51 +19,58 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
-    {
-        vol.Required("username"): str,
-        vol.Required("password"): str,
-        vol.Required("region"): selector(
-            {
-                "select": {
-                    "options": ["United States", "Saudi Arabia", "Europe"],
-                },
-            }
-        ),
-    }
-)
+# Region names shown to the user (and stored in config entries) -> Region
+_REGIONS: dict[str, Region] = {
+    "United States": Region.US,
+    "Saudi Arabia": Region.SA,
+    "Europe": Region.EU,
+}
+
+
+@cache
+def _user_data_schema() -> vol.Schema:
+    """Build the user step schema the first time the form is shown."""
+    return vol.Schema(
+        {
+            vol.Required("username"): str,
+            vol.Required("password"): str,
+            vol.Required("region"): selector(
+                {
+                    "select": {
+                        "options": list(_REGIONS),
+                    },
+                }
+            ),
+        }
+    )
 
 
 def region_by_name(name: str) -> Region:
-    match name:
-        case "United States":
-            return Region.US
-        case "Saudi Arabia":
-            return Region.SA
-        case "Europe":
-            return Region.EU
-        case _:
-            raise ValueError("Unsupported region")
+    """Look up a Region by its user-facing name."""
+    try:
+        return _REGIONS[name]
+    except KeyError:
+        raise ValueError("Unsupported region") from None
 
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
-    Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+    Data has the keys from _user_data_schema() with values provided by the user.
     """
 
     region = region_by_name(data["region"])
 
-    api = LucidAPI(region=region)
-
-    try:
-        await api.login(data["username"], data["password"])
+    # Only used to check the credentials, so close the channel when done
+    async with LucidAPI(region=region) as api:
+        try:
+            await api.login(data["username"], data["password"])
 
-    except APIError as e:
-        _LOGGER.error("Authentication failed: %s", e)
-        raise InvalidAuth
+        except APIError as e:
+            _LOGGER.error("Authentication failed: %s", e)
+            raise InvalidAuth
 
-    user = api.user
+        user = api.user
 
     assert user is not None  # if we logged in, we are a user
 
@@ -96,7 +104,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="user", data_schema=_user_data_schema(), errors=errors
         )
 
 
@@ -3,10 +3,23 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta, datetime
+from collections.abc import Callable
+from datetime import timedelta
+from functools import cache
+import heapq
 import logging
-
-from lucidmotors import APIError, LucidAPI, Vehicle, StatusCode, PowerState
+from operator import attrgetter
+from typing import Any
+
+from google.protobuf.message import Message
+from lucidmotors import (
+    APIError,
+    GetDocumentInfoResponse,
+    LucidAPI,
+    Vehicle,
+    StatusCode,
+    PowerState,
+)
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -21,54 +34,121 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
-class LucidDataUpdateCoordinator(DataUpdateCoordinator):
-    """Lucid API update coordinator."""
+@cache
+def path_getter(path: tuple[str, ...]) -> Callable[[Vehicle], Any]:
+    """Get a function that looks up the given attribute path on a Vehicle.
+
+    Getters are shared, so every entity and expected update watching the same
+    path uses the same one.
+    """
+    return attrgetter(".".join(path))
+
+
+class LucidDataUpdateCoordinator(DataUpdateCoordinator[dict[str, bytes]]):
+    """Lucid API update coordinator.
+
+    The coordinator's data is a map of VIN -> serialized vehicle state. It is
+    only used to let DataUpdateCoordinator detect when nothing has changed;
+    entities read their Vehicle from vehicles_by_vin.
+    """
 
     api: LucidAPI
     username: str
     password: str
     update_interval: timedelta
 
-    # Map of VIN -> Vehicle.
-    _vehicles: dict[str, Vehicle]
+    # Map of VIN -> Vehicle. This is what entities update from.
+    vehicles_by_vin: dict[str, Vehicle]
+
+    # Map of vin -> path -> (timeout, getter for path). Tracks updates we've
+    # requested and are expecting to see soon. Timeouts are event loop
+    # (monotonic) times.
+    _expected_updates: dict[
+        str, dict[tuple[str, ...], tuple[float, Callable[[Vehicle], Any]]]
+    ]
+
+    # Heap of (timeout, vin, path) for _expected_updates, so expired entries
+    # can be found without scanning every path. May hold stale entries for
+    # paths that have since been cleared or had their timeout extended.
+    _expiries: list[tuple[float, str, tuple[str, ...]]]
+
+    _update_lock: asyncio.Lock
+
+    # Set by a poll that resolved expected updates, so listeners are notified
+    # once the refresh completes even if the data didn't change.
+    _notify_unchanged: bool
 
-    # Map of vin -> path -> timeout. Tracks updates we've requested and are
-    # expecting to see soon.
-    _expected_updates: dict[str, dict[tuple[str, ...], datetime]]
+    # Map of software version -> release notes lookup, so vehicles on the same
+    # version share a single API call. Versions no vehicle reports anymore are
+    # dropped after each poll.
+    _release_notes: dict[str, asyncio.Task[GetDocumentInfoResponse]]
 
     def __init__(
         self, hass: HomeAssistant, api: LucidAPI, username: str, password: str
     ) -> None:
         """Initialize the Lucid data update coordinator."""
-        assert api.user is not None
+        user = api.user
+        assert user is not None
 
         super().__init__(
             hass,
             _LOGGER,
-            name=f"Lucid account {api.user.username}",
+            name=f"Lucid account {user.username}",
             update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            # Don't notify entities when the vehicle data is unchanged
+            always_update=False,
         )
         self.api = api
         self.username = username
         self.password = password
-        self._vehicles = {}
+        self.vehicles_by_vin = {}
         self._expected_updates = {}
-
-    async def _async_update_data(self) -> None:
+        self._expiries = []
+        # Held while a poll is in flight, so polls never overlap
+        self._update_lock = asyncio.Lock()
+        self._notify_unchanged = False
+        self._release_notes = {}
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh data, then notify listeners if an expected update lapsed.
+
+        DataUpdateCoordinator skips notifying when the data is unchanged, e.g.
+        when the car ignored a command. Entities showing optimistic state still
+        need to hear about it, which can only happen once the refresh has
+        stored its result.
+        """
+        previous = (self.data, self.last_update_success)
+        await super()._async_refresh(*args, **kwargs)
+        if self._notify_unchanged:
+            self._notify_unchanged = False
+            if (self.data, self.last_update_success) == previous:
+                self.async_update_listeners()
+
+    async def _async_update_data(self) -> dict[str, bytes]:
+        """Fetch new data from API, unless a poll is already in progress."""
+        if self._update_lock.locked():
+            # The in-flight poll will publish fresh data when it finishes.
+            return self.data
+        async with self._update_lock:
+            return await self._async_poll()
+
+    async def _async_poll(self) -> dict[str, bytes]:
         """Fetch new data from API."""
         try:
-            # If session will expire before our next update (* 1.5 for some wiggle
-            # room), we should refresh our token now.
-            async with asyncio.timeout(10):
+            # One budget for both calls, so a slow token refresh can't leave
+            # the vehicle fetch without any time of its own.
+            async with asyncio.timeout(15):
+                # If session will expire before our next update (* 1.5 for some
+                # wiggle room), we should refresh our token now.
                 if self.api.session_time_remaining < (self.update_interval * 1.5):
                     _LOGGER.info(
                         "Session expires in %r, refreshing token",
                         self.api.session_time_remaining,
                     )
                     await self.api.authentication_refresh()
-            async with asyncio.timeout(10):
                 await self.api.fetch_vehicles()
-                _LOGGER.info("Vehicles: %r", self.api.vehicles)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Vehicles: %r", self.api.vehicles)
         except APIError as err:
             if err.code == StatusCode.UNAUTHENTICATED:  # token expired
                 # NOTE: This also updates vehicles. If we switch to a
@@ -82,69 +162,92 @@ class LucidDataUpdateCoordinator(DataUpdateCoordinator):
         # Adjust our update interval based on vehicle state
         idle_update_interval = DEFAULT_UPDATE_INTERVAL
 
-        # Check if any expected vehicle config/state has changed
-        updated_or_expired = []
-        current_time = datetime.now()
+        # Serialized protobuf Messages by id(), shared between the expected
+        # update checks below so overlapping paths are only serialized once.
+        # The Message is kept alongside so its id() can't be reused.
+        serialized: dict[int, tuple[Message, bytes]] = {}
+
+        def serialize(message: Message) -> bytes:
+            if (cached := serialized.get(id(message))) is None:
+                cached = (message, message.SerializeToString(deterministic=True))
+                serialized[id(message)] = cached
+            return cached[1]
+
+        # Clear expected values which have timed out
+        any_updated_or_expired = self._clear_expired_updates()
+
+        # Check if any expected vehicle config/state has changed, clearing
+        # expected values which have changed as we go.
 
         for vehicle in self.api.vehicles:
             # If any vehicle is awake, let's poll more often
             if vehicle.state.power != PowerState.POWER_STATE_SLEEP:
                 idle_update_interval = AWAKE_UPDATE_INTERVAL
 
-            expected_updates = self._expected_updates.get(vehicle.config.vin, {})
-            old_vehicle = self._vehicles.get(vehicle.config.vin, None)
+            vin = vehicle.config.vin
+            expected_updates = self._expected_updates.get(vin)
+            if not expected_updates:
+                continue
 
-            if expected_updates and old_vehicle is None:
+            old_vehicle = self.vehicles_by_vin.get(vin, None)
+            if old_vehicle is None:
                 # The VIN just appeared out of nowhere? That sounds like a
                 # change to me.
-                self._expected_updates.pop(vehicle.config.vin)
+                del self._expected_updates[vin]
                 continue
 
-            for path, timeout in expected_updates.items():
-                old_value = old_vehicle
-                new_value = vehicle
-
-                for key in path:
-                    _LOGGER.info("OLD: get %r from %r", key, old_value)
-                    _LOGGER.info("NEW: get %r from %r", key, new_value)
-                    old_value = getattr(old_value, key)
-                    new_value = getattr(new_value, key)
+            for path, (_, getter) in list(expected_updates.items()):
+                old_value = getter(old_vehicle)
+                new_value = getter(vehicle)
 
+                if old_value is new_value:
+                    equal = True
                 # Compare protobuf Messages - they do not have a working __eq__
-                if hasattr(old_value, "SerializeToString"):
+                elif hasattr(old_value, "SerializeToString"):
                     assert old_value is not None
                     assert new_value is not None
-                    equal = old_value.SerializeToString(
-                        deterministic=True
-                    ) == new_value.SerializeToString(deterministic=True)
+                    # Messages of different encoded sizes can't be equal, and
+                    # ByteSize() doesn't allocate, so only serialize on a size match.
+                    equal = old_value.ByteSize() == new_value.ByteSize() and (
+                        serialize(old_value) == serialize(new_value)
+                    )
                 # Compare anything else
                 else:
                     equal = old_value == new_value
 
-                _LOGGER.info(
-                    "State %s => %r equal? %r timeout? %r",
-                    vehicle.config.vin,
-                    path,
-                    equal,
-                    timeout <= current_time,
-                )
-
-                if not equal or timeout <= current_time:
-                    updated_or_expired.append((vehicle.config.vin, path))
-
-        # Clear expected for values which have changed or timed out
-        for vin, path in updated_or_expired:
-            self._expected_updates[vin].pop(path)
-            if not self._expected_updates[vin]:
-                self._expected_updates.pop(vin)
-
-        # Rebuild our local vehicle list - this is what entities update from
-        self._vehicles.clear()
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "State %s => %r (old: %r, new: %r) equal? %r",
+                        vin,
+                        path,
+                        old_value,
+                        new_value,
+                        equal,
+                    )
+
+                if not equal:
+                    del expected_updates[path]
+                    any_updated_or_expired = True
+
+            if not expected_updates:
+                del self._expected_updates[vin]
+
+        # Update our local vehicle list in place - this is what entities
+        # update from. The VIN set rarely changes, so only touch what differs.
+        vehicles_by_vin = self.vehicles_by_vin
+        new_vins = set()
         for vehicle in self.api.vehicles:
-            self._vehicles[vehicle.config.vin] = vehicle
+            vin = vehicle.config.vin
+            new_vins.add(vin)
+            if vehicles_by_vin.get(vin) is not vehicle:
+                vehicles_by_vin[vin] = vehicle
+        for vin in vehicles_by_vin.keys() - new_vins:
+            del vehicles_by_vin[vin]
+
+        self._prune_release_notes()
 
         # In fast update mode, check if we need to drop back down to the regular interval
-        if updated_or_expired and not self._expected_updates:
+        if any_updated_or_expired and not self._expected_updates:
             self.update_interval = timedelta(seconds=idle_update_interval)
             self._fast_update_timeout = None
             _LOGGER.info("Fast update mode DISengaged")
@@ -153,9 +256,94 @@ class LucidDataUpdateCoordinator(DataUpdateCoordinator):
             # awake or default update interval depending on vehicle state.
             self.update_interval = timedelta(seconds=idle_update_interval)
 
+        if any_updated_or_expired:
+            # Entities may be showing optimistic state for these; make sure
+            # they hear about this poll even if the data is unchanged.
+            self._notify_unchanged = True
+
+        # Protobuf Messages do not have a working __eq__, so hand the
+        # coordinator something that does.
+        return {
+            vin: vehicle.SerializeToString(deterministic=True)
+            for vin, vehicle in self.vehicles_by_vin.items()
+        }
+
+    def _clear_expired_updates(self) -> bool:
+        """Drop expected updates whose timeout has passed.
+
+        Returns whether any were dropped.
+        """
+        expiries = self._expiries
+        if not self._expected_updates:
+            # Nothing left to expire; drop any stale entries
+            expiries.clear()
+            return False
+
+        now = self.hass.loop.time()
+        any_expired = False
+
+        while expiries and expiries[0][0] <= now:
+            timeout, vin, path = heapq.heappop(expiries)
+            expected_updates = self._expected_updates.get(vin)
+            if expected_updates is None:
+                continue
+            # Skip stale heap entries for cleared or extended paths
+            expected = expected_updates.get(path)
+            if expected is None or expected[0] != timeout:
+                continue
+
+            _LOGGER.debug("Expected update to %s => %r timed out", vin, path)
+            del expected_updates[path]
+            if not expected_updates:
+                del self._expected_updates[vin]
+            any_expired = True
+
+        return any_expired
+
     def get_vehicle(self, vin: str) -> Vehicle | None:
         """Look up a Vehicle object by VIN."""
-        return self._vehicles.get(vin, None)
+        return self.vehicles_by_vin.get(vin, None)
+
+    def _prune_release_notes(self) -> None:
+        """Forget release notes for versions no vehicle reports anymore.
+
+        Lookups still in flight are left to finish for whoever awaits them.
+        """
+        if not self._release_notes:
+            return
+        versions = set()
+        for vehicle in self.vehicles_by_vin.values():
+            versions.add(vehicle.state.chassis.software_version)
+            versions.add(vehicle.state.software_update.version_available)
+        for version in self._release_notes.keys() - versions:
+            del self._release_notes[version]
+
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and any release note lookups in flight."""
+        await super().async_shutdown()
+        for task in self._release_notes.values():
+            task.cancel()
+        self._release_notes.clear()
+
+    async def get_release_notes(self, version: str) -> GetDocumentInfoResponse:
+        """Get the release notes for a software version.
+
+        Concurrent and later calls for the same version share one lookup. A
+        failed lookup is forgotten, so the next call tries again.
+        """
+        task = self._release_notes.get(version)
+        if task is None:
+            task = self._release_notes[version] = self.hass.async_create_task(
+                self.api.get_update_release_notes(version)
+            )
+        try:
+            # Shielded so that one cancelled caller doesn't cancel the lookup
+            # for everyone else waiting on it.
+            return await asyncio.shield(task)
+        except Exception:
+            if self._release_notes.get(version) is task:
+                del self._release_notes[version]
+            raise
 
     async def expect_update(self, vin: str, path: tuple[str, ...]) -> None:
         """Tell the coordinator to expect a data update to the given field soon.
@@ -163,12 +351,24 @@ class LucidDataUpdateCoordinator(DataUpdateCoordinator):
         The coordinator will check for updates more frequently until the data
         actually changes, or until FAST_UPDATE_TIMEOUT seconds pass.
         """
-        _LOGGER.info("Fast update mode engaged")
+        if not self._expected_updates:
+            _LOGGER.info("Fast update mode engaged")
         self.update_interval = timedelta(seconds=FAST_UPDATE_INTERVAL)
 
-        if vin not in self._expected_updates:
-            self._expected_updates[vin] = {}
-
-        expiration_time = datetime.now() + timedelta(seconds=FAST_UPDATE_TIMEOUT)
-        self._expected_updates[vin][path] = expiration_time
+        now = self.hass.loop.time()
+        expiration_time = now + FAST_UPDATE_TIMEOUT
+        expected_updates = self._expected_updates.setdefault(vin, {})
+
+        if (expected := expected_updates.get(path)) is not None and expected[0] > now:
+            # Already waiting on this field: just push the deadline out. The
+            # fast update interval will pick up the change without another
+            # refresh request.
+            expected_updates[path] = (expiration_time, expected[1])
+            heapq.heappush(self._expiries, (expiration_time, vin, path))
+            return
+
+        expected_updates[path] = (expiration_time, path_getter(path))
+        heapq.heappush(self._expiries, (expiration_time, vin, path))
+        # Requests are debounced by DataUpdateCoordinator, so back-to-back
+        # calls from several entities coalesce into a single refresh.
         await self.async_request_refresh()
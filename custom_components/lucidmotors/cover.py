@@ -22,7 +22,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LucidBaseEntity
 from .const import DOMAIN
-from .coordinator import LucidDataUpdateCoordinator
+from .coordinator import LucidDataUpdateCoordinator, path_getter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ _LOGGER = logging.getLogger(__name__)
 class LucidCoverEntityDescriptionMixin:
     """Mixin to describe a Lucid cover entity."""
 
-    key_path: list[str]
+    key_path: tuple[str, ...]
     open_function: Callable[[LucidAPI, Vehicle], Coroutine[None, None, None]]
     close_function: Callable[[LucidAPI, Vehicle], Coroutine[None, None, None]]
     open_value: Any
@@ -47,30 +47,30 @@ class LucidCoverEntityDescription(
 COVER_TYPES: tuple[LucidCoverEntityDescription, ...] = (
     LucidCoverEntityDescription(
         key="charge_port",
-        key_path=["state", "body"],
+        key_path=("state", "body"),
         translation_key="charge_port_door",
         icon="mdi:ev-plug-ccs1",
         open_value=DoorState.DOOR_STATE_OPEN,
-        close_function=lambda api, vehicle: api.charge_port_close(vehicle),
-        open_function=lambda api, vehicle: api.charge_port_open(vehicle),
+        close_function=LucidAPI.charge_port_close,
+        open_function=LucidAPI.charge_port_open,
     ),
     LucidCoverEntityDescription(
         key="rear_cargo",
-        key_path=["state", "body"],
+        key_path=("state", "body"),
         translation_key="rear_cargo",
         icon="mdi:car-sports",
         open_value=DoorState.DOOR_STATE_OPEN,
-        close_function=lambda api, vehicle: api.trunk_close(vehicle),
-        open_function=lambda api, vehicle: api.trunk_open(vehicle),
+        close_function=LucidAPI.trunk_close,
+        open_function=LucidAPI.trunk_open,
     ),
     LucidCoverEntityDescription(
         key="front_cargo",
-        key_path=["state", "body"],
+        key_path=("state", "body"),
         translation_key="front_cargo",
         icon="mdi:car-sports",
         open_value=DoorState.DOOR_STATE_OPEN,
-        close_function=lambda api, vehicle: api.frunk_close(vehicle),
-        open_function=lambda api, vehicle: api.frunk_open(vehicle),
+        close_function=LucidAPI.frunk_close,
+        open_function=LucidAPI.frunk_open,
     ),
 )
 
@@ -83,17 +83,11 @@ async def async_setup_entry(
     """Set up the Lucid sensors from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidCover] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.extend(
-            [
-                LucidCover(coordinator, vehicle, description)
-                for description in COVER_TYPES
-            ]
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        LucidCover(coordinator, vehicle, description)
+        for vehicle in coordinator.api.vehicles
+        for description in COVER_TYPES
+    )
 
 
 class LucidCover(LucidBaseEntity, CoverEntity):
@@ -101,6 +95,9 @@ class LucidCover(LucidBaseEntity, CoverEntity):
 
     entity_description: LucidCoverEntityDescription
     _attr_has_entity_name: bool = True
+    _expect_update_path: tuple[str, ...]
+    _state_getter: Callable[[Vehicle], Any]
+    _last_state: tuple[bool, Any] | None = None
 
     def __init__(
         self,
@@ -112,7 +109,9 @@ class LucidCover(LucidBaseEntity, CoverEntity):
         super().__init__(coordinator, vehicle)
         self.entity_description = description
         self.api = coordinator.api
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
+        self._expect_update_path = (*description.key_path, description.key)
+        self._state_getter = path_getter(self._expect_update_path)
         self._attr_supported_features = CoverEntityFeature.OPEN
         # Note: Pure's frunk has STRUT_TYPE_GAS, not powered open/close. Close
         # doesn't actually do anything.
@@ -125,57 +124,58 @@ class LucidCover(LucidBaseEntity, CoverEntity):
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
+        description = self.entity_description
+        vehicle = self.vehicle
 
-        _LOGGER.debug(
-            "Closing %s of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
+        _LOGGER.debug("Closing %s of %s", description.key, vehicle.config.nickname)
 
         try:
-            await self.entity_description.close_function(self.api, self.vehicle)
+            await description.close_function(self.api, vehicle)
             # Update our local state for the entity so that it doesn't appear
-            # to revert to its previous state until the next API update
+            # to revert to its previous state until the car reports the change,
+            # or the expected update times out.
             self._attr_is_closed = True
             self.async_write_ha_state()
         except APIError as ex:
             raise HomeAssistantError(ex) from ex
+        await self.coordinator.expect_update(self.vin, self._expect_update_path)
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open cover."""
+        description = self.entity_description
+        vehicle = self.vehicle
 
-        _LOGGER.debug(
-            "Opening %s of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
+        _LOGGER.debug("Opening %s of %s", description.key, vehicle.config.nickname)
 
         try:
-            await self.entity_description.open_function(self.api, self.vehicle)
+            await description.open_function(self.api, vehicle)
             self._attr_is_closed = False
             self.async_write_ha_state()
         except APIError as ex:
             raise HomeAssistantError(ex) from ex
-
-    @property
-    def is_closed(self):
-        """Returns True if cover is closed."""
-        return self._attr_is_closed
+        await self.coordinator.expect_update(self.vin, self._expect_update_path)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        _LOGGER.debug(
-            "Updating cover '%s' of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updating cover '%s' of %s",
+                self.entity_description.key,
+                self.vehicle.config.nickname,
+            )
+
+        state = self._state_getter(self.vehicle)
+
+        is_closed = state != self.entity_description.open_value
 
-        state = self.vehicle
-        for attr in self.entity_description.key_path:
-            state = getattr(state, attr)
-        state = getattr(state, self.entity_description.key)
+        # Skip the state write if neither the vehicle nor our (possibly
+        # optimistic) local state has changed since the last update.
+        last_state = (self.coordinator.last_update_success, state)
+        if last_state == self._last_state and is_closed == self._attr_is_closed:
+            return
+        self._last_state = last_state
 
-        self._attr_is_closed = state != self.entity_description.open_value
+        self._attr_is_closed = is_closed
         super()._handle_coordinator_update()
@@ -9,7 +9,7 @@ from lucidmotors import Vehicle
 
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LucidBaseEntity
@@ -40,34 +40,47 @@ class LucidTrackerEntity(LucidBaseEntity, TrackerEntity):
     _attr_force_update: bool = False
     _attr_icon: str = "mdi:car"
 
+    # Refreshed on each coordinator update, so HA's property reads don't have
+    # to walk the vehicle state every time.
+    _location: Any
+    _gps_attrs: dict[str, Any]
+
     def __init__(
         self, coordinator: LucidDataUpdateCoordinator, vehicle: Vehicle
     ) -> None:
         """Initialize the vehicle tracker."""
         super().__init__(coordinator, vehicle)
 
-        self._attr_unique_id = self.vehicle.config.vin
+        self._attr_unique_id = self.vin
         self._attr_name = None
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        gps = self.vehicle.state.gps
+        self._location = gps.location
+        self._gps_attrs = {
+            **self._attrs,
+            ATTR_DIRECTION: gps.heading_precise,
+            ATTR_ELEVATION: gps.elevation,
+            ATTR_POSITION_TIME: gps.position_time,
+        }
+        super()._handle_coordinator_update()
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        return {
-            **self._attrs,
-            ATTR_DIRECTION: self.vehicle.state.gps.heading_precise,
-            ATTR_ELEVATION: self.vehicle.state.gps.elevation,
-            ATTR_POSITION_TIME: self.vehicle.state.gps.position_time,
-        }
+        return self._gps_attrs
 
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the vehicle."""
-        return self.vehicle.state.gps.location.latitude
+        return self._location.latitude
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the vehicle."""
-        return self.vehicle.state.gps.location.longitude
+        return self._location.longitude
 
     @property
     def source_type(self) -> SourceType:
@@ -23,7 +23,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LucidBaseEntity
 from .const import DOMAIN
-from .coordinator import LucidDataUpdateCoordinator
+from .coordinator import LucidDataUpdateCoordinator, path_getter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +32,7 @@ _LOGGER = logging.getLogger(__name__)
 class LucidLightEntityDescriptionMixin:
     """Mixin to describe a Lucid Light entity."""
 
-    key_path: list[str]
+    key_path: tuple[str, ...]
     turn_on_function: Callable[[LucidAPI, Vehicle], Coroutine[None, None, None]]
     turn_off_function: Callable[[LucidAPI, Vehicle], Coroutine[None, None, None]]
     flash_function: Callable[[LucidAPI, Vehicle], Coroutine[None, None, None]]
@@ -50,12 +50,12 @@ class LucidLightEntityDescription(
 LIGHT_TYPES: tuple[LucidLightEntityDescription, ...] = (
     LucidLightEntityDescription(
         key="headlights",
-        key_path=["state", "chassis"],
+        key_path=("state", "chassis"),
         translation_key="headlights",
         icon="mdi:car-light-high",
-        turn_on_function=lambda api, vehicle: api.lights_on(vehicle),
-        turn_off_function=lambda api, vehicle: api.lights_off(vehicle),
-        flash_function=lambda api, vehicle: api.lights_flash(vehicle),
+        turn_on_function=LucidAPI.lights_on,
+        turn_off_function=LucidAPI.lights_off,
+        flash_function=LucidAPI.lights_flash,
         off_value=LightState.LIGHT_STATE_OFF,
         on_value=LightState.LIGHT_STATE_ON,
     ),
@@ -70,17 +70,11 @@ async def async_setup_entry(
     """Set up the Lucid sensors from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidLight] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.extend(
-            [
-                LucidLight(coordinator, vehicle, description)
-                for description in LIGHT_TYPES
-            ]
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        LucidLight(coordinator, vehicle, description)
+        for vehicle in coordinator.api.vehicles
+        for description in LIGHT_TYPES
+    )
 
 
 class LucidLight(LucidBaseEntity, LightEntity):
@@ -88,7 +82,11 @@ class LucidLight(LucidBaseEntity, LightEntity):
 
     entity_description: LucidLightEntityDescription
     _attr_has_entity_name: bool = True
-    _is_on: bool | None
+    _expect_update_path: tuple[str, ...]
+    _state_getter: Callable[[Vehicle], Any]
+    # Light state -> is_on. Anything else (e.g. UNKNOWN) is reported as None.
+    _is_on_by_state: dict[Any, bool]
+    _last_state: tuple[bool, Any] | None = None
 
     def __init__(
         self,
@@ -100,7 +98,13 @@ class LucidLight(LucidBaseEntity, LightEntity):
         super().__init__(coordinator, vehicle)
         self.entity_description = description
         self.api = coordinator.api
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
+        self._expect_update_path = (*description.key_path, description.key)
+        self._state_getter = path_getter(self._expect_update_path)
+        self._is_on_by_state = {
+            description.off_value: False,
+            description.on_value: True,
+        }
         self._attr_supported_color_modes = {ColorMode.ONOFF}
         self._attr_color_mode = ColorMode.ONOFF
         self._attr_supported_features = LightEntityFeature.FLASH
@@ -108,38 +112,38 @@ class LucidLight(LucidBaseEntity, LightEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            "Updating light '%s' of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
-        state = self.vehicle
-        for attr in self.entity_description.key_path:
-            state = getattr(state, attr)
-        state = getattr(state, self.entity_description.key)
-        # Using != off_value rather than == on_value so that UNKNOWN states
-        # will be considered on. This may not always be the right answer, but I
-        # think it's better to turn unknown things off rather than on?
-        if state == self.entity_description.off_value:
-            self._is_on = False
-        elif state == self.entity_description.on_value:
-            self._is_on = True
-        else:
-            self._is_on = None
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updating light '%s' of %s",
+                self.entity_description.key,
+                self.vehicle.config.nickname,
+            )
+        state = self._state_getter(self.vehicle)
+        is_on = self._is_on_by_state.get(state)
+
+        # Skip the state write if neither the vehicle nor our local state has
+        # changed since the last update.
+        last_state = (self.coordinator.last_update_success, state)
+        if last_state == self._last_state and is_on == self._attr_is_on:
+            return
+        self._last_state = last_state
+
+        self._attr_is_on = is_on
         super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
+        description = self.entity_description
+        vehicle = self.vehicle
         if ATTR_FLASH in kwargs:
-            await self.entity_description.flash_function(self.api, self.vehicle)
+            await description.flash_function(self.api, vehicle)
         else:
             try:
-                await self.entity_description.turn_on_function(self.api, self.vehicle)
+                await description.turn_on_function(self.api, vehicle)
                 self.async_write_ha_state()
             except APIError as ex:
                 raise HomeAssistantError(ex) from ex
-        path = tuple(self.entity_description.key_path + [self.entity_description.key])
-        await self.coordinator.expect_update(self.vehicle.config.vin, path)
+        await self.coordinator.expect_update(self.vin, self._expect_update_path)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
@@ -148,10 +152,4 @@ class LucidLight(LucidBaseEntity, LightEntity):
             self.async_write_ha_state()
         except APIError as ex:
             raise HomeAssistantError(ex) from ex
-        path = tuple(self.entity_description.key_path + [self.entity_description.key])
-        await self.coordinator.expect_update(self.vehicle.config.vin, path)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Get the current state of the switch."""
-        return self._is_on
+        await self.coordinator.expect_update(self.vin, self._expect_update_path)
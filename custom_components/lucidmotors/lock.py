@@ -17,7 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LucidBaseEntity
 from .const import DOMAIN
-from .coordinator import LucidDataUpdateCoordinator
+from .coordinator import LucidDataUpdateCoordinator, path_getter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,7 +26,7 @@ _LOGGER = logging.getLogger(__name__)
 class LucidLockEntityDescriptionMixin:
     """Mixin to describe a Lucid lock entity."""
 
-    key_path: list[str]
+    key_path: tuple[str, ...]
     lock_function: Callable[[LucidAPI, Vehicle], Coroutine[None, None, None]]
     unlock_function: Callable[[LucidAPI, Vehicle], Coroutine[None, None, None]]
     unlocked_value: Any
@@ -42,12 +42,12 @@ class LucidLockEntityDescription(
 LOCK_TYPES: tuple[LucidLockEntityDescription, ...] = (
     LucidLockEntityDescription(
         key="door_locks",
-        key_path=["state", "body"],
+        key_path=("state", "body"),
         translation_key="door_locks",
         icon="mdi:car-door-lock",
         unlocked_value=LockState.LOCK_STATE_UNLOCKED,
-        lock_function=lambda api, vehicle: api.doors_lock(vehicle),
-        unlock_function=lambda api, vehicle: api.doors_unlock(vehicle),
+        lock_function=LucidAPI.doors_lock,
+        unlock_function=LucidAPI.doors_unlock,
     ),
 )
 
@@ -60,14 +60,11 @@ async def async_setup_entry(
     """Set up the Lucid sensors from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidLock] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.extend(
-            [LucidLock(coordinator, vehicle, description) for description in LOCK_TYPES]
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        LucidLock(coordinator, vehicle, description)
+        for vehicle in coordinator.api.vehicles
+        for description in LOCK_TYPES
+    )
 
 
 class LucidLock(LucidBaseEntity, LockEntity):
@@ -75,7 +72,9 @@ class LucidLock(LucidBaseEntity, LockEntity):
 
     entity_description: LucidLockEntityDescription
     _attr_has_entity_name: bool = True
-    _is_on: bool
+    _expect_update_path: tuple[str, ...]
+    _state_getter: Callable[[Vehicle], Any]
+    _last_state: tuple[bool, Any] | None = None
 
     def __init__(
         self,
@@ -87,56 +86,64 @@ class LucidLock(LucidBaseEntity, LockEntity):
         super().__init__(coordinator, vehicle)
         self.entity_description = description
         self.api = coordinator.api
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
+        self._expect_update_path = (*description.key_path, description.key)
+        self._state_getter = path_getter(self._expect_update_path)
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock door."""
+        description = self.entity_description
+        vehicle = self.vehicle
 
-        _LOGGER.debug(
-            "Locking %s of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
+        _LOGGER.debug("Locking %s of %s", description.key, vehicle.config.nickname)
 
         try:
-            await self.entity_description.lock_function(self.api, self.vehicle)
+            await description.lock_function(self.api, vehicle)
             # Update our local state for the entity so that it doesn't appear
-            # to revert to its previous state until the next API update
+            # to revert to its previous state until the car reports the change,
+            # or the expected update times out.
             self._attr_is_locked = True
             self.async_write_ha_state()
         except APIError as ex:
             raise HomeAssistantError(ex) from ex
+        await self.coordinator.expect_update(self.vin, self._expect_update_path)
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock door."""
+        description = self.entity_description
+        vehicle = self.vehicle
 
-        _LOGGER.debug(
-            "Unlocking %s of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
+        _LOGGER.debug("Unlocking %s of %s", description.key, vehicle.config.nickname)
 
         try:
-            await self.entity_description.unlock_function(self.api, self.vehicle)
+            await description.unlock_function(self.api, vehicle)
             self._attr_is_locked = False
             self.async_write_ha_state()
         except APIError as ex:
             raise HomeAssistantError(ex) from ex
+        await self.coordinator.expect_update(self.vin, self._expect_update_path)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        _LOGGER.debug(
-            "Updating lock '%s' of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updating lock '%s' of %s",
+                self.entity_description.key,
+                self.vehicle.config.nickname,
+            )
+
+        state = self._state_getter(self.vehicle)
+
+        is_locked = state != self.entity_description.unlocked_value
 
-        state = self.vehicle
-        for attr in self.entity_description.key_path:
-            state = getattr(state, attr)
-        state = getattr(state, self.entity_description.key)
+        # Skip the state write if neither the vehicle nor our (possibly
+        # optimistic) local state has changed since the last update.
+        last_state = (self.coordinator.last_update_success, state)
+        if last_state == self._last_state and is_locked == self._attr_is_locked:
+            return
+        self._last_state = last_state
 
-        self._attr_is_locked = state != self.entity_description.unlocked_value
+        self._attr_is_locked = is_locked
         super()._handle_coordinator_update()
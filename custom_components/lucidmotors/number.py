@@ -5,19 +5,20 @@ from __future__ import annotations
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 import logging
+from typing import Any
 
 from lucidmotors import Vehicle, APIError, LucidAPI
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.const import PERCENTAGE
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LucidBaseEntity
 from .const import DOMAIN
-from .coordinator import LucidDataUpdateCoordinator
+from .coordinator import LucidDataUpdateCoordinator, path_getter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,8 +27,7 @@ _LOGGER = logging.getLogger(__name__)
 class LucidNumberEntityDescriptionMixin:
     """Mixin to describe a Lucid number entity."""
 
-    key_path: list[str]
-    native_value_fn: Callable[[Vehicle], float]
+    key_path: tuple[str, ...]
     set_native_value_fn: Callable[
         [LucidAPI, Vehicle, float], Coroutine[None, None, None]
     ]
@@ -43,15 +43,12 @@ class LucidNumberEntityDescription(
 NUMBER_TYPES: tuple[LucidNumberEntityDescription, ...] = (
     LucidNumberEntityDescription(
         key="charge_limit_percent",
-        key_path=["state", "charging"],
+        key_path=("state", "charging"),
         translation_key="charging_target",
         icon="mdi:ev-station",
         native_step=1,
         native_unit_of_measurement=PERCENTAGE,
         native_min_value=50.0,  # Enforced by Lucid API
-        native_value_fn=lambda vehicle: round(
-            vehicle.state.charging.charge_limit_percent
-        ),
         set_native_value_fn=lambda api, vehicle, value: api.set_charge_limit(
             vehicle, round(value)
         ),
@@ -67,17 +64,11 @@ async def async_setup_entry(
     """Set up the Lucid numbers from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidNumber] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.extend(
-            [
-                LucidNumber(coordinator, vehicle, description)
-                for description in NUMBER_TYPES
-            ]
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        LucidNumber(coordinator, vehicle, description)
+        for vehicle in coordinator.api.vehicles
+        for description in NUMBER_TYPES
+    )
 
 
 class LucidNumber(LucidBaseEntity, NumberEntity):
@@ -86,6 +77,8 @@ class LucidNumber(LucidBaseEntity, NumberEntity):
     entity_description: LucidNumberEntityDescription
     _attr_has_entity_name: bool = True
     _is_on: bool
+    _expect_update_path: tuple[str, ...]
+    _value_getter: Callable[[Vehicle], Any]
 
     def __init__(
         self,
@@ -97,12 +90,15 @@ class LucidNumber(LucidBaseEntity, NumberEntity):
         super().__init__(coordinator, vehicle)
         self.entity_description = description
         self.api = coordinator.api
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
+        self._expect_update_path = (*description.key_path, description.key)
+        self._value_getter = path_getter(self._expect_update_path)
 
-    @property
-    def native_value(self) -> float:
-        """Return native value."""
-        return self.entity_description.native_value_fn(self.vehicle)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_native_value = round(self._value_getter(self.vehicle))
+        super()._handle_coordinator_update()
 
     async def async_set_native_value(self, value: float) -> None:
         """Update value."""
@@ -114,10 +110,21 @@ class LucidNumber(LucidBaseEntity, NumberEntity):
             value,
         )
 
+        # Show the new value right away rather than after the API round trip,
+        # and put the old one back if the request fails.
+        previous_value = self._attr_native_value
+        self._attr_native_value = value
+        self.async_write_ha_state()
+
         try:
             await self.entity_description.set_native_value_fn(
                 self.api, self.vehicle, value
             )
-            self.async_write_ha_state()
         except APIError as ex:
+            self._attr_native_value = previous_value
+            self.async_write_ha_state()
             raise HomeAssistantError(ex) from ex
+
+        # If the car doesn't take the new value, the coordinator will notify us
+        # when this times out so we show what it actually reports.
+        await self.coordinator.expect_update(self.vin, self._expect_update_path)
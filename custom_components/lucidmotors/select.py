@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Mapping
 from dataclasses import dataclass
 import logging
 from typing import Any
@@ -20,20 +20,18 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LucidBaseEntity
 from .const import DOMAIN
-from .coordinator import LucidDataUpdateCoordinator
+from .coordinator import LucidDataUpdateCoordinator, path_getter
 
 _LOGGER = logging.getLogger(__name__)
 
-OPTION_TO_MODE_MAP = {
-    "Off": AlarmMode.ALARM_MODE_OFF,
-    "On": AlarmMode.ALARM_MODE_ON,
-    "Push Notifications Only": AlarmMode.ALARM_MODE_SILENT,
-}
-MODE_TO_OPTION_MAP = {
-    AlarmMode.ALARM_MODE_OFF: "Off",
-    AlarmMode.ALARM_MODE_ON: "On",
-    AlarmMode.ALARM_MODE_SILENT: "Push Notifications Only",
-}
+# (alarm mode, option) pairs, in the order options are offered
+_ALARM_MODE_OPTIONS: tuple[tuple[int, str], ...] = (
+    (AlarmMode.ALARM_MODE_OFF, "Off"),
+    (AlarmMode.ALARM_MODE_ON, "On"),
+    (AlarmMode.ALARM_MODE_SILENT, "Push Notifications Only"),
+)
+OPTION_TO_MODE_MAP = {option: mode for mode, option in _ALARM_MODE_OPTIONS}
+MODE_TO_OPTION_MAP = dict(_ALARM_MODE_OPTIONS)
 
 
 @dataclass(frozen=True)
@@ -42,7 +40,8 @@ class LucidSelectEntityDescriptionMixin:
 
     key_path: list[str]
     select_fn: Callable[[LucidAPI, Vehicle, AlarmMode], Coroutine[None, None, None]]
-    current_value_fn: Callable[[Vehicle], str]
+    option_to_mode: Mapping[str, Any]
+    mode_to_option: Mapping[Any, str]
 
 
 @dataclass(frozen=True)
@@ -59,8 +58,9 @@ SELECT_TYPES: tuple[LucidSelectEntityDescription, ...] = (
         translation_key="alarm",
         icon="mdi:shield-car",
         options=[*OPTION_TO_MODE_MAP],
-        select_fn=lambda api, vehicle, mode: api.alarm_control(vehicle, mode),
-        current_value_fn=lambda vehicle: MODE_TO_OPTION_MAP[vehicle.state.alarm.mode],
+        option_to_mode=OPTION_TO_MODE_MAP,
+        mode_to_option=MODE_TO_OPTION_MAP,
+        select_fn=LucidAPI.alarm_control,
     ),
 )
 
@@ -73,17 +73,11 @@ async def async_setup_entry(
     """Set up the Lucid sensors from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidSelect] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.extend(
-            [
-                LucidSelect(coordinator, vehicle, description)
-                for description in SELECT_TYPES
-            ]
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        LucidSelect(coordinator, vehicle, description)
+        for vehicle in coordinator.api.vehicles
+        for description in SELECT_TYPES
+    )
 
 
 class LucidSelect(LucidBaseEntity, SelectEntity):
@@ -91,6 +85,9 @@ class LucidSelect(LucidBaseEntity, SelectEntity):
 
     entity_description: LucidSelectEntityDescription
     _attr_has_entity_name: bool = True
+    _expect_update_path: tuple[str, ...]
+    _state_getter: Callable[[Vehicle], Any]
+    _last_state: tuple[bool, Any] | None = None
 
     def __init__(
         self,
@@ -102,7 +99,9 @@ class LucidSelect(LucidBaseEntity, SelectEntity):
         super().__init__(coordinator, vehicle)
         self.entity_description = description
         self.api = coordinator.api
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
+        self._expect_update_path = (*description.key_path, description.key)
+        self._state_getter = path_getter(self._expect_update_path)
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -112,20 +111,39 @@ class LucidSelect(LucidBaseEntity, SelectEntity):
             self.entity_description.key,
             self.vehicle.config.nickname,
         )
-        state = self.vehicle
-        for attr in self.entity_description.key_path:
-            state = getattr(state, attr)
-        state = getattr(state, self.entity_description.key)
-
+        state = self._state_getter(self.vehicle)
+        current_option = self.entity_description.mode_to_option.get(state)
+
+        # Skip the state write if neither the vehicle nor our (possibly
+        # optimistic) local state has changed since the last update.
+        last_state = (self.coordinator.last_update_success, state)
+        if (
+            last_state == self._last_state
+            and current_option == self._attr_current_option
+        ):
+            return
+        self._last_state = last_state
+
+        self._attr_current_option = current_option
         super()._handle_coordinator_update()
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the selected entity option to represent the entity state."""
-        return self.entity_description.current_value_fn(self.vehicle)
-
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        await self.entity_description.select_fn(
-            self.api, self.vehicle, OPTION_TO_MODE_MAP[option]
-        )
+        mode = self.entity_description.option_to_mode[option]
+
+        # Show the new option right away rather than after the API round trip,
+        # and put the old one back if the request fails.
+        previous_option = self._attr_current_option
+        self._attr_current_option = option
+        self.async_write_ha_state()
+
+        try:
+            await self.entity_description.select_fn(self.api, self.vehicle, mode)
+        except APIError as ex:
+            self._attr_current_option = previous_option
+            self.async_write_ha_state()
+            raise HomeAssistantError(ex) from ex
+
+        # If the car doesn't take the new mode, the coordinator will notify us
+        # when this times out so we show what it actually reports.
+        await self.coordinator.expect_update(self.vin, self._expect_update_path)
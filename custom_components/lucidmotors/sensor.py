@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import logging
-from typing import cast, Optional
+from typing import Any, cast
 
+from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 from lucidmotors import (
     Vehicle,
     AlarmMode,
@@ -42,27 +43,49 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.util.unit_conversion import DistanceConverter
 
 from . import LucidBaseEntity
 from .const import DOMAIN
-from .coordinator import LucidDataUpdateCoordinator
+from .coordinator import LucidDataUpdateCoordinator, path_getter
 
 _LOGGER = logging.getLogger(__name__)
 
+# Miles per kilometer (an international mile is exactly 1.609344 km)
+_KM_TO_MI = 1 / 1.609344
 
-@dataclass
+
+def _enum_mapper(enum_type: EnumTypeWrapper) -> Callable[[int, HomeAssistant], str]:
+    """Get a sensor value function that converts an enum value to a string.
+
+    The strings for all known values are looked up once, up front. Values the
+    enum didn't know about at import time go through enum_to_str() the first
+    time they're seen, and are remembered from then on.
+    """
+    names = {value: enum_to_str(enum_type, value) for value in enum_type.values()}
+
+    def value_fn(value: int, _: HomeAssistant) -> str:
+        if (name := names.get(value)) is None:
+            name = names[value] = enum_to_str(enum_type, value)
+        return name
+
+    return value_fn
+
+
+@dataclass(frozen=True)
 class LucidSensorEntityDescription(SensorEntityDescription):
     """Describes Lucid sensor entity."""
 
-    key_path: list[str] = field(default_factory=list)
-    value: Callable = lambda x, y: x
+    key_path: tuple[str, ...] = ()
+    # Converts the raw API value for display. None uses the value as-is.
+    value: Callable | None = None
+    # Raw API value meaning "no reading", reported as unknown. None disables.
+    sentinel: Any = None
 
 
-SENSOR_TYPES: list[LucidSensorEntityDescription] = [
+SENSOR_TYPES: tuple[LucidSensorEntityDescription, ...] = (
     LucidSensorEntityDescription(
         key="charge_percent",
-        key_path=["state", "battery"],
+        key_path=("state", "battery"),
         translation_key="remaining_battery_percent",
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
@@ -71,7 +94,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="kwhr",
-        key_path=["state", "battery"],
+        key_path=("state", "battery"),
         translation_key="remaining_battery_power",
         device_class=SensorDeviceClass.ENERGY_STORAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -80,7 +103,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="capacity_kwhr",
-        key_path=["state", "battery"],
+        key_path=("state", "battery"),
         translation_key="battery_capacity",
         device_class=SensorDeviceClass.ENERGY_STORAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -89,7 +112,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="charge_session_kwh",
-        key_path=["state", "charging"],
+        key_path=("state", "charging"),
         translation_key="charge_session_power",
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -99,7 +122,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="charge_session_mi",
-        key_path=["state", "charging"],
+        key_path=("state", "charging"),
         translation_key="charge_session_range",
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -109,7 +132,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="charge_rate_kwh_precise",
-        key_path=["state", "charging"],
+        key_path=("state", "charging"),
         translation_key="charging_rate",
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
@@ -118,7 +141,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="charge_rate_mph_precise",
-        key_path=["state", "charging"],
+        key_path=("state", "charging"),
         translation_key="charging_rate_distance",
         device_class=SensorDeviceClass.SPEED,
         state_class=SensorStateClass.MEASUREMENT,
@@ -127,17 +150,17 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="session_minutes_remaining",
-        key_path=["state", "charging"],
+        key_path=("state", "charging"),
         translation_key="charge_session_time_remaining",
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
         native_unit_of_measurement=UnitOfTime.MINUTES,
-        value=lambda value, _: None if value == CHARGE_SESSION_TIME_MAX else value,
+        sentinel=CHARGE_SESSION_TIME_MAX,
     ),
     LucidSensorEntityDescription(
         key="remaining_range",
-        key_path=["state", "battery"],
+        key_path=("state", "battery"),
         translation_key="remaining_range",
         icon="mdi:map-marker-distance",
         device_class=SensorDeviceClass.DISTANCE,
@@ -146,7 +169,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="odometer_km",
-        key_path=["state", "chassis"],
+        key_path=("state", "chassis"),
         translation_key="mileage",
         icon="mdi:counter",
         device_class=SensorDeviceClass.DISTANCE,
@@ -156,7 +179,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="exterior_temp",
-        key_path=["state", "cabin"],
+        key_path=("state", "cabin"),
         translation_key="exterior_temp",
         icon="mdi:thermometer",
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -166,7 +189,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="interior_temp",
-        key_path=["state", "cabin"],
+        key_path=("state", "cabin"),
         translation_key="interior_temp",
         icon="mdi:thermometer",
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -176,114 +199,114 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="front_left_tire_pressure_bar",
-        key_path=["state", "chassis"],
+        key_path=("state", "chassis"),
         translation_key="front_left_tire_pressure",
         icon="mdi:tire",
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
         suggested_display_precision=1,
-        value=lambda value, _: None if value == TIRE_PRESSURE_MAX else value,
+        sentinel=TIRE_PRESSURE_MAX,
     ),
     LucidSensorEntityDescription(
         key="front_right_tire_pressure_bar",
-        key_path=["state", "chassis"],
+        key_path=("state", "chassis"),
         translation_key="front_right_tire_pressure",
         icon="mdi:tire",
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
         suggested_display_precision=1,
-        value=lambda value, _: None if value == TIRE_PRESSURE_MAX else value,
+        sentinel=TIRE_PRESSURE_MAX,
     ),
     LucidSensorEntityDescription(
         key="rear_left_tire_pressure_bar",
-        key_path=["state", "chassis"],
+        key_path=("state", "chassis"),
         translation_key="rear_left_tire_pressure",
         icon="mdi:tire",
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
         suggested_display_precision=1,
-        value=lambda value, _: None if value == TIRE_PRESSURE_MAX else value,
+        sentinel=TIRE_PRESSURE_MAX,
     ),
     LucidSensorEntityDescription(
         key="rear_right_tire_pressure_bar",
-        key_path=["state", "chassis"],
+        key_path=("state", "chassis"),
         translation_key="rear_right_tire_pressure",
         icon="mdi:tire",
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
         suggested_display_precision=1,
-        value=lambda value, _: None if value == TIRE_PRESSURE_MAX else value,
+        sentinel=TIRE_PRESSURE_MAX,
     ),
     LucidSensorEntityDescription(
         key="mode",
-        key_path=["state", "alarm"],
+        key_path=("state", "alarm"),
         translation_key="alarm_mode",
         icon="mdi:shield-lock",
-        value=lambda value, _: enum_to_str(AlarmMode, value),
+        value=_enum_mapper(AlarmMode),
     ),
     LucidSensorEntityDescription(
         key="status",
-        key_path=["state", "alarm"],
+        key_path=("state", "alarm"),
         translation_key="alarm_status",
         icon="mdi:shield-lock",
-        value=lambda value, _: enum_to_str(AlarmStatus, value),
+        value=_enum_mapper(AlarmStatus),
     ),
     LucidSensorEntityDescription(
         key="paint_color",
-        key_path=["config"],
+        key_path=("config",),
         translation_key="paint_color",
         icon="mdi:palette",
-        value=lambda value, _: enum_to_str(PaintColor, value),
+        value=_enum_mapper(PaintColor),
     ),
     LucidSensorEntityDescription(
         key="look",
-        key_path=["config"],
+        key_path=("config",),
         translation_key="look",
         icon="mdi:car-outline",
-        value=lambda value, _: enum_to_str(Look, value),
+        value=_enum_mapper(Look),
     ),
     LucidSensorEntityDescription(
         key="wheels",
-        key_path=["config"],
+        key_path=("config",),
         translation_key="wheels",
         icon="mdi:tire",
-        value=lambda value, _: enum_to_str(Wheels, value),
+        value=_enum_mapper(Wheels),
     ),
     LucidSensorEntityDescription(
         key="power",
-        key_path=["state"],
+        key_path=("state",),
         translation_key="power_state",
         icon="mdi:power-settings",
-        value=lambda value, _: enum_to_str(PowerState, value),
+        value=_enum_mapper(PowerState),
     ),
     LucidSensorEntityDescription(
         key="energy_type",
-        key_path=["state", "charging"],
+        key_path=("state", "charging"),
         translation_key="energy_type",
         icon="mdi:current-ac",
-        value=lambda value, _: enum_to_str(EnergyType, value),
+        value=_enum_mapper(EnergyType),
     ),
     LucidSensorEntityDescription(
         key="drive_mode",
-        key_path=["state"],
+        key_path=("state",),
         translation_key="drive_mode",
         icon="mdi:car-settings",
-        value=lambda value, _: enum_to_str(DriveMode, value),
+        value=_enum_mapper(DriveMode),
     ),
     LucidSensorEntityDescription(
         key="gear_position",
-        key_path=["state"],
+        key_path=("state",),
         translation_key="gear_position",
         icon="mdi:car-shift-pattern",
-        value=lambda value, _: enum_to_str(GearPosition, value),
+        value=_enum_mapper(GearPosition),
     ),
     LucidSensorEntityDescription(
         key="max_cell_temp",
-        key_path=["state", "battery"],
+        key_path=("state", "battery"),
         translation_key="max_cell_temp",
         icon="mdi:thermometer-chevron-up",
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -293,7 +316,7 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="min_cell_temp",
-        key_path=["state", "battery"],
+        key_path=("state", "battery"),
         translation_key="min_cell_temp",
         icon="mdi:thermometer-chevron-down",
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -303,14 +326,34 @@ SENSOR_TYPES: list[LucidSensorEntityDescription] = [
     ),
     LucidSensorEntityDescription(
         key="battery_health_level",
-        key_path=["state", "battery"],
+        key_path=("state", "battery"),
         translation_key="battery_health_level",
         icon="mdi:stethoscope",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=1,
     ),
-]
+)
+
+
+# Derived sensors, computed from several API values rather than read from a key
+EFFICIENCY_DESCRIPTION = LucidSensorEntityDescription(
+    key="efficiency",
+    key_path=(),  # Unused
+    translation_key="efficiency",
+    icon="mdi:lightning-bolt",
+    native_unit_of_measurement="Wh/mi",
+)
+SPEED_DESCRIPTION = LucidSensorEntityDescription(
+    key="speed",
+    key_path=(),  # Unused
+    translation_key="speed",
+    icon="mdi:speedometer",
+    device_class=SensorDeviceClass.SPEED,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+    native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+)
 
 
 async def async_setup_entry(
@@ -321,48 +364,18 @@ async def async_setup_entry(
     """Set up the Lucid sensors from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidSensor] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.extend(
-            [
+    async_add_entities(
+        sensor
+        for vehicle in coordinator.api.vehicles
+        for sensor in (
+            *(
                 LucidSensor(coordinator, vehicle, description)
                 for description in SENSOR_TYPES
-            ]
-        )
-
-        entities.append(
-            LucidEfficiencySensor(
-                coordinator,
-                vehicle,
-                LucidSensorEntityDescription(
-                    key="efficiency",
-                    key_path=[],  # Unused
-                    translation_key="efficiency",
-                    icon="mdi:lightning-bolt",
-                    native_unit_of_measurement="Wh/mi",
-                ),
-            )
+            ),
+            LucidEfficiencySensor(coordinator, vehicle, EFFICIENCY_DESCRIPTION),
+            LucidSpeedSensor(coordinator, vehicle, SPEED_DESCRIPTION),
         )
-
-        entities.append(
-            LucidSpeedSensor(
-                coordinator,
-                vehicle,
-                LucidSensorEntityDescription(
-                    key="speed",
-                    key_path=[],  # Unused
-                    translation_key="speed",
-                    icon="mdi:speedometer",
-                    device_class=SensorDeviceClass.SPEED,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-                ),
-            )
-        )
-
-    async_add_entities(entities)
+    )
 
 
 class LucidSensor(LucidBaseEntity, SensorEntity):
@@ -370,6 +383,10 @@ class LucidSensor(LucidBaseEntity, SensorEntity):
 
     entity_description: LucidSensorEntityDescription
     _attr_has_entity_name: bool = True
+    _state_getter: Callable[[Vehicle], Any]
+    _value_fn: Callable | None
+    _sentinel: Any
+    _last_state: tuple[bool, Any] | None = None
 
     def __init__(
         self,
@@ -380,84 +397,96 @@ class LucidSensor(LucidBaseEntity, SensorEntity):
         """Initialize Lucid vehicle sensor."""
         super().__init__(coordinator, vehicle)
         self.entity_description = description
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
+        self._attr_translation_key = description.translation_key
+        self._state_getter = path_getter((*description.key_path, description.key))
+        self._value_fn = description.value
+        self._sentinel = description.sentinel
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            "Updating sensor '%s' of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
-        state = self.vehicle
-        for attr in self.entity_description.key_path:
-            state = getattr(state, attr)
-        state = getattr(state, self.entity_description.key)
-        self._attr_native_value = cast(
-            StateType, self.entity_description.value(state, self.hass)
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updating sensor '%s' of %s",
+                self.entity_description.key,
+                self.vehicle.config.nickname,
+            )
+        state = self._state_getter(self.vehicle)
+
+        # Most polls leave most sensors unchanged; don't convert and write the
+        # same value again.
+        last_state = (self.coordinator.last_update_success, state)
+        if last_state == self._last_state:
+            return
+        self._last_state = last_state
+
+        if self._sentinel is not None and state == self._sentinel:
+            state = None
+        elif (value_fn := self._value_fn) is not None:
+            state = value_fn(state, self.hass)
+        self._attr_native_value = cast(StateType, state)
         super()._handle_coordinator_update()
 
-    @property
-    def translation_key(self) -> str | None:
-        """Return the translation key to translate the entity's states."""
-        return self.entity_description.translation_key
-
 
 class LucidEfficiencySensor(LucidSensor):
     """Driving efficiency sensor derived from Lucid API data."""
 
-    _saved_odometer: Optional[float] = None
-    _saved_charge: Optional[float] = None
+    _saved_odometer: float | None = None
+    _saved_charge: float | None = None
+    _last_state: tuple[bool, float | None] | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            "Updating sensor '%s' of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updating sensor '%s' of %s",
+                self.entity_description.key,
+                self.vehicle.config.nickname,
+            )
 
         current_odometer = self.vehicle.state.chassis.odometer_km
         current_charge = self.vehicle.state.battery.kwhr
 
-        if self._saved_odometer is None:
-            self._saved_odometer = current_odometer
-        if self._saved_charge is None:
-            self._saved_charge = current_charge
-
-        odo_diff = current_odometer - self._saved_odometer
-        charge_diff = current_charge - self._saved_charge
+        if self._saved_odometer is None or current_odometer == self._saved_odometer:
+            # First update, or we haven't moved (which is most polls). There's
+            # no efficiency to report, so skip the math.
+            value = None
+        else:
+            assert self._saved_charge is not None
+            odo_diff = current_odometer - self._saved_odometer
+            charge_diff = current_charge - self._saved_charge
 
-        # Convert kWh to Wh
-        charge_diff *= 1000.0
+            # Convert kWh to Wh
+            charge_diff *= 1000.0
 
-        # What we're looking for is the rate of discharge, which is negative
-        # charge_diff.
-        charge_diff = -charge_diff
+            # What we're looking for is the rate of discharge, which is
+            # negative charge_diff.
+            charge_diff = -charge_diff
 
-        # HA doesn't have automatic unit conversion for Wh/mi type units, so
-        # we'll have to convert manually here to miles so us non-metric folks
-        # can survive.
-        odo_diff = DistanceConverter.convert(
-            odo_diff,
-            UnitOfLength.KILOMETERS,
-            UnitOfLength.MILES,
-        )
+            # HA doesn't have automatic unit conversion for Wh/mi type units,
+            # so we'll have to convert manually here to miles so us
+            # non-metric folks can survive.
+            odo_diff *= _KM_TO_MI
 
-        if odo_diff == 0.0:
-            # We haven't moved. Also avoid zero division.
-            value = None
-        else:
-            # Wh / mi
-            value = charge_diff / odo_diff
+            if odo_diff == 0.0:
+                # Avoid zero division
+                value = None
+            else:
+                # Wh / mi
+                value = charge_diff / odo_diff
 
         # Update saved
         self._saved_odometer = current_odometer
         self._saved_charge = current_charge
 
+        # Most polls leave the derived value unchanged; don't write it again.
+        last_state = (self.coordinator.last_update_success, value)
+        if last_state == self._last_state:
+            return
+        self._last_state = last_state
+
         self._attr_native_value = cast(StateType, value)
         super(LucidSensor, self)._handle_coordinator_update()
 
@@ -465,41 +494,49 @@ class LucidEfficiencySensor(LucidSensor):
 class LucidSpeedSensor(LucidSensor):
     """Driving speed sensor derived from Lucid API data."""
 
-    _saved_odometer: Optional[float] = None
-    _saved_timestamp: Optional[int] = None
+    _saved_odometer: float | None = None
+    _saved_timestamp: int | None = None
+    _last_state: tuple[bool, float | None] | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            "Updating sensor '%s' of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updating sensor '%s' of %s",
+                self.entity_description.key,
+                self.vehicle.config.nickname,
+            )
 
         current_odometer = self.vehicle.state.chassis.odometer_km
         current_timestamp = self.vehicle.state.last_updated_ms
 
-        if self._saved_odometer is None:
-            self._saved_odometer = current_odometer
-        if self._saved_timestamp is None:
-            self._saved_timestamp = current_timestamp
-
-        odo_diff = current_odometer - self._saved_odometer
-        time_diff = current_timestamp - self._saved_timestamp
-        # Milliseconds to (fractional) hours
-        time_diff /= 1000.0  # -> Seconds
-        time_diff /= 60.0  # -> Minutes
-        time_diff /= 60.0  # -> Hours
-
-        if time_diff == 0.0:
-            value = 0.0  # Avoid zero division
+        if self._saved_odometer is None or current_odometer == self._saved_odometer:
+            # First update, or we haven't moved (which is most polls)
+            value = 0.0
         else:
-            value = odo_diff / time_diff
+            assert self._saved_timestamp is not None
+            odo_diff = current_odometer - self._saved_odometer
+            time_diff = current_timestamp - self._saved_timestamp
+            # Milliseconds to (fractional) hours
+            time_diff /= 1000.0  # -> Seconds
+            time_diff /= 60.0  # -> Minutes
+            time_diff /= 60.0  # -> Hours
+
+            if time_diff == 0.0:
+                value = 0.0  # Avoid zero division
+            else:
+                value = odo_diff / time_diff
 
         # Update saved
         self._saved_timestamp = current_timestamp
         self._saved_odometer = current_odometer
 
+        # Most polls leave the derived value unchanged; don't write it again.
+        last_state = (self.coordinator.last_update_success, value)
+        if last_state == self._last_state:
+            return
+        self._last_state = last_state
+
         self._attr_native_value = cast(StateType, value)
         super(LucidSensor, self)._handle_coordinator_update()
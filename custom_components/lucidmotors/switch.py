@@ -28,7 +28,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import LucidBaseEntity
 from .const import DOMAIN
-from .coordinator import LucidDataUpdateCoordinator
+from .coordinator import LucidDataUpdateCoordinator, path_getter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,7 +37,7 @@ _LOGGER = logging.getLogger(__name__)
 class LucidSwitchEntityDescriptionMixin:
     """Mixin to describe a Lucid Switch entity."""
 
-    key_path: list[str]
+    key_path: tuple[str, ...]
     turn_on_function: Callable[[LucidAPI, Vehicle], Coroutine[None, None, None]]
     turn_off_function: Callable[[LucidAPI, Vehicle], Coroutine[None, None, None]]
     on_value: Any
@@ -53,22 +53,22 @@ class LucidSwitchEntityDescription(
 SWITCH_TYPES: tuple[LucidSwitchEntityDescription, ...] = (
     LucidSwitchEntityDescription(
         key="charge_state",
-        key_path=["state", "charging"],
+        key_path=("state", "charging"),
         translation_key="charging",
         icon="mdi:ev-station",
         device_class=SwitchDeviceClass.SWITCH,
-        turn_on_function=lambda api, vehicle: api.start_charging(vehicle),
-        turn_off_function=lambda api, vehicle: api.stop_charging(vehicle),
+        turn_on_function=LucidAPI.start_charging,
+        turn_off_function=LucidAPI.stop_charging,
         on_value=ChargeState.CHARGE_STATE_CHARGING,
     ),
     LucidSwitchEntityDescription(
         key="preconditioning_status",
-        key_path=["state", "battery"],
+        key_path=("state", "battery"),
         translation_key="battery_preconditioning",
         icon="mdi:battery-plus-variant",
         device_class=SwitchDeviceClass.SWITCH,
-        turn_on_function=lambda api, vehicle: api.battery_precon_on(vehicle),
-        turn_off_function=lambda api, vehicle: api.battery_precon_off(vehicle),
+        turn_on_function=LucidAPI.battery_precon_on,
+        turn_off_function=LucidAPI.battery_precon_off,
         on_value=BatteryPreconStatus.BATTERY_PRECON_ON,
     ),
 )
@@ -82,17 +82,11 @@ async def async_setup_entry(
     """Set up the Lucid sensors from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[LucidSwitch] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.extend(
-            [
-                LucidSwitch(coordinator, vehicle, description)
-                for description in SWITCH_TYPES
-            ]
-        )
-
-    async_add_entities(entities)
+    async_add_entities(
+        LucidSwitch(coordinator, vehicle, description)
+        for vehicle in coordinator.api.vehicles
+        for description in SWITCH_TYPES
+    )
 
 
 class LucidSwitch(LucidBaseEntity, SwitchEntity):
@@ -100,7 +94,8 @@ class LucidSwitch(LucidBaseEntity, SwitchEntity):
 
     entity_description: LucidSwitchEntityDescription
     _attr_has_entity_name: bool = True
-    _is_on: bool
+    _state_getter: Callable[[Vehicle], Any]
+    _last_state: tuple[bool, Any] | None = None
 
     def __init__(
         self,
@@ -112,28 +107,40 @@ class LucidSwitch(LucidBaseEntity, SwitchEntity):
         super().__init__(coordinator, vehicle)
         self.entity_description = description
         self.api = coordinator.api
-        self._attr_unique_id = f"{vehicle.config.vin}-{description.key}"
+        self._attr_unique_id = self._vin_prefix + description.key
+        self._attr_translation_key = description.translation_key
+        self._state_getter = path_getter((*description.key_path, description.key))
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            "Updating switch '%s' of %s",
-            self.entity_description.key,
-            self.vehicle.config.nickname,
-        )
-        state = self.vehicle
-        for attr in self.entity_description.key_path:
-            state = getattr(state, attr)
-        state = getattr(state, self.entity_description.key)
-
-        self._is_on = state == self.entity_description.on_value
+        description = self.entity_description
+        vehicle = self.vehicle
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Updating switch '%s' of %s",
+                description.key,
+                vehicle.config.nickname,
+            )
+        state = self._state_getter(vehicle)
+
+        is_on = state == description.on_value
+
+        # Skip the state write if neither the vehicle nor our (possibly
+        # optimistic) local state has changed since the last update.
+        last_state = (self.coordinator.last_update_success, state)
+        if last_state == self._last_state and is_on == self._attr_is_on:
+            return
+        self._last_state = last_state
+
+        self._attr_is_on = is_on
         super()._handle_coordinator_update()
 
     async def _expect_update(self) -> None:
         await self.coordinator.expect_update(
             self.vehicle.config.vin,
-            tuple([*self.entity_description.key_path, self.entity_description.key]),
+            (*self.entity_description.key_path, self.entity_description.key),
         )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -142,7 +149,7 @@ class LucidSwitch(LucidBaseEntity, SwitchEntity):
             await self.entity_description.turn_on_function(self.api, self.vehicle)
             # Update our local state for the entity so that it doesn't appear
             # to revert to its previous state until the next API update
-            self._is_on = True
+            self._attr_is_on = True
             self.async_write_ha_state()
             await self._expect_update()
         except APIError as ex:
@@ -152,13 +159,8 @@ class LucidSwitch(LucidBaseEntity, SwitchEntity):
         """Turn off the switch."""
         try:
             await self.entity_description.turn_off_function(self.api, self.vehicle)
-            self._is_on = False
+            self._attr_is_on = False
             self.async_write_ha_state()
             await self._expect_update()
         except APIError as ex:
             raise HomeAssistantError(ex) from ex
-
-    @property
-    def is_on(self) -> bool:
-        """Get the current state of the switch."""
-        return self._is_on
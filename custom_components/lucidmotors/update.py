@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 from typing import Any
-import httpx
 from markdownify import markdownify as md
 
 from lucidmotors import Vehicle, APIError, UpdateState
 
 from homeassistant.components.update import UpdateEntity, UpdateEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.httpx_client import get_async_client
 
 from . import LucidBaseEntity
 from .const import DOMAIN
@@ -21,6 +24,20 @@ from .coordinator import LucidDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Rendered release notes by URL, with the ETag they were served with, so
+# reopening the same notes only costs a conditional request. Kept in least
+# recently used order.
+_RELEASE_NOTES_CACHE: dict[str, tuple[str, str]] = {}
+_RELEASE_NOTES_CACHE_SIZE = 16
+
+_RELEASE_NOTES_LANGUAGE = "en-US,en;q=0.9"
+
+# Script and style blocks aren't part of the notes; strip them before
+# markdownify has to parse them.
+_UNRENDERED_HTML = re.compile(
+    r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,13 +46,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Lucid update entity from config entry."""
     coordinator: LucidDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    entities: list[LucidUpdateEntity] = []
-
-    for vehicle in coordinator.api.vehicles:
-        entities.append(LucidUpdateEntity(coordinator, vehicle))
+    entities = [
+        LucidUpdateEntity(coordinator, vehicle) for vehicle in coordinator.api.vehicles
+    ]
 
-    for entity in entities:
-        await entity.async_update()
+    # Fetch the release notes for all vehicles at once, not one after another
+    await asyncio.gather(*(entity.async_update() for entity in entities))
 
     async_add_entities(entities)
 
@@ -51,28 +67,59 @@ class LucidUpdateEntity(LucidBaseEntity, UpdateEntity):
         | UpdateEntityFeature.RELEASE_NOTES
     )
 
+    # The version whose release notes were last fetched
+    _release_notes_version: str | None = None
+
     def __init__(
         self, coordinator: LucidDataUpdateCoordinator, vehicle: Vehicle
     ) -> None:
         """Initialize the vehicle tracker."""
         super().__init__(coordinator, vehicle)
 
-        self._attr_unique_id = f"{vehicle.config.vin}-update"
+        self._attr_unique_id = self._vin_prefix + "update"
         self._attr_name = None
         self.api = coordinator.api
+        # Setup fetches release notes for the latest version before the entity
+        # is added, so the versions must already be known.
+        self._update_versions()
+        # Every coordinator update asks for the notes of a new version until
+        # they've been fetched; coalesce those into one lookup.
+        self._release_notes_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=5.0,
+            immediate=True,
+            function=self._async_refresh_release_notes,
+        )
 
-    @property
-    def installed_version(self) -> str:
-        """Return the current software version of the vehicle."""
-        return self.vehicle.state.chassis.software_version
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._release_notes_debouncer.async_cancel)
 
-    @property
-    def latest_version(self) -> str:
-        """Return the latest available software version."""
+    def _update_versions(self) -> None:
+        """Read the installed and latest software versions from the vehicle."""
+        state = self.vehicle.state
+        self._attr_installed_version = state.chassis.software_version
         # The API reports version 0 if there is no update available.
-        if self.vehicle.state.software_update.version_available_raw == 0:
-            return self.installed_version
-        return self.vehicle.state.software_update.version_available
+        if state.software_update.version_available_raw == 0:
+            self._attr_latest_version = self._attr_installed_version
+        else:
+            self._attr_latest_version = state.software_update.version_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_versions()
+        if self._attr_latest_version != self._release_notes_version:
+            config_entry = self.coordinator.config_entry
+            assert config_entry is not None
+            config_entry.async_create_background_task(
+                self.hass,
+                self._release_notes_debouncer.async_call(),
+                f"{self.entity_id} release notes",
+            )
+        super()._handle_coordinator_update()
 
     @property
     def in_progress(self) -> bool | int:
@@ -88,22 +135,55 @@ class LucidUpdateEntity(LucidBaseEntity, UpdateEntity):
     async def async_release_notes(self) -> str | None:
         """Return the release notes."""
 
-        async with httpx.AsyncClient() as client:
-            try:
-                assert self._attr_release_url is not None
+        if self.latest_version == self.installed_version:
+            # No update available, so there's nothing to describe
+            return None
+        if (url := self._attr_release_url) is None:
+            # Release notes haven't been looked up for this version yet
+            return None
 
+        # Home Assistant's shared client keeps connections to the release notes
+        # host alive between calls, and is closed by Home Assistant on shutdown.
+        client = get_async_client(self.hass)
+        try:
+            headers = {"Accept-Language": _RELEASE_NOTES_LANGUAGE}
+            if (cached := _RELEASE_NOTES_CACHE.get(url)) is not None:
+                headers["If-None-Match"] = cached[0]
+
+            response = await client.get(
+                url,
+                follow_redirects=True,
+                headers=headers,
+            )
+
+            if response.status_code == 304:
+                if cached is not None:
+                    # Mark as most recently used
+                    _RELEASE_NOTES_CACHE[url] = _RELEASE_NOTES_CACHE.pop(url)
+                    return cached[1]
+                # Not modified, but we have nothing to reuse; ask for the page
+                # itself.
                 response = await client.get(
-                    self._attr_release_url,
+                    url,
                     follow_redirects=True,
-                    headers={"Accept-Language": "en-US,en;q=0.9"},
+                    headers={
+                        "Accept-Language": _RELEASE_NOTES_LANGUAGE,
+                        "Cache-Control": "no-cache",
+                    },
                 )
 
-                if response.status_code == 200:
-                    return md(response.text)
-                else:
-                    return f"Failed to retrieve content from {self._attr_release_url}. Status code: {response.status_code}"
-            except Exception as ex:
-                raise HomeAssistantError(ex) from ex
+            if response.status_code == 200:
+                notes = md(_UNRENDERED_HTML.sub("", response.text))
+                if etag := response.headers.get("ETag"):
+                    if len(_RELEASE_NOTES_CACHE) >= _RELEASE_NOTES_CACHE_SIZE:
+                        # Drop the least recently used entry
+                        del _RELEASE_NOTES_CACHE[next(iter(_RELEASE_NOTES_CACHE))]
+                    _RELEASE_NOTES_CACHE[url] = (etag, notes)
+                return notes
+            else:
+                return f"Failed to retrieve content from {url}. Status code: {response.status_code}"
+        except Exception as ex:
+            raise HomeAssistantError(ex) from ex
 
     async def async_update(self) -> None:
         """Update state of entity."""
@@ -113,16 +193,40 @@ class LucidUpdateEntity(LucidBaseEntity, UpdateEntity):
             self.latest_version,
         )
 
-        update_release_notes = await self.api.get_update_release_notes(
-            self.latest_version
-        )
+        latest_version = self.latest_version
+        update_release_notes = await self.coordinator.get_release_notes(latest_version)
 
         self._attr_release_url = update_release_notes.url
         self._attr_release_summary = update_release_notes.info.description
+        self._release_notes_version = latest_version
+
+    async def _async_refresh_release_notes(self) -> None:
+        """Fetch the release notes for a newly available version."""
+        try:
+            await self.async_update()
+        except APIError as ex:
+            _LOGGER.warning(
+                "Failed to get release notes for %s: %s",
+                self.vehicle.config.nickname,
+                ex,
+            )
+            return
+        except Exception:  # pylint: disable=broad-except
+            # Nothing awaits this task, so nothing else would report this
+            _LOGGER.exception(
+                "Unexpected error getting release notes for %s",
+                self.vehicle.config.nickname,
+            )
+            return
+        self.async_write_ha_state()
 
     async def async_install(self, version, backup: bool, **kwargs: Any) -> None:
         """Install an Update."""
 
+        if self.latest_version == self.installed_version:
+            _LOGGER.debug("No update to install on %s", self.vehicle.config.nickname)
+            return
+
         _LOGGER.debug(
             "Installing update %s on %s",
             self.latest_version,
@@ -130,8 +234,7 @@ class LucidUpdateEntity(LucidBaseEntity, UpdateEntity):
         )
 
         try:
-            if self.latest_version != self.installed_version:
-                await self.api.apply_update(self.vehicle)
-                self.async_write_ha_state()
+            await self.api.apply_update(self.vehicle)
+            self.async_write_ha_state()
         except APIError as ex:
             raise HomeAssistantError(ex) from ex